@@ -7,11 +7,13 @@ Anomaly score is a 0–1 composite of:
   3. Skew score      – yes_bid far from complement of no_bid (internal inconsistency)
 """
 
+import heapq
 from dataclasses import dataclass, field
-from typing import Optional
+from operator import attrgetter
+from typing import Iterable, Iterator, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketSignal:
     ticker: str
     title: str
@@ -26,43 +28,68 @@ class MarketSignal:
     midpoint: float         # (yes_bid + yes_ask) / 2
     skew: float             # |yes_bid - (100 - no_ask)| — internal inconsistency
     anomaly_score: float    # composite 0–1
-    flags: list[str] = field(default_factory=list)
+    flags: tuple[str, ...] = ()
     close_time: Optional[str] = None
     event_ticker: Optional[str] = None
     subtitle: Optional[str] = None
+    url: str = field(init=False)    # kalshi.com market page, derived once at construction
 
+    def __post_init__(self) -> None:
+        self.url = market_url(self.event_ticker, self.ticker)
 
-def _spread_score(spread: float, midpoint: float) -> float:
-    """Higher score for larger spread relative to midpoint."""
-    if midpoint <= 0:
-        return 0.0
-    # A 20-cent spread on a 50-cent market is significant
-    relative = spread / max(midpoint, 1)
-    return min(relative / 0.5, 1.0)   # saturates at 50% relative spread
 
+def market_url(event_ticker: Optional[str], ticker: str) -> str:
+    """Kalshi web page for a market; markets are browsed by event prefix."""
+    key = event_ticker or ticker
+    base, sep, _ = key.rpartition("-")
+    return f"https://kalshi.com/markets/{base if sep else key}"
 
-def _liquidity_score(volume_24h: int, open_interest: int, max_vol: int) -> float:
-    """Higher score for lower volume (more illiquid)."""
-    vol_score = 1.0 - min(volume_24h / max(max_vol, 1), 1.0)
-    oi_score = 1.0 - min(open_interest / max(max_vol * 5, 1), 1.0)
-    return 0.6 * vol_score + 0.4 * oi_score
 
+def _liquidity_caps(max_vol: int) -> tuple[int, int]:
+    """Volume / open-interest ceilings, computed once per scan rather than per market."""
+    return max(max_vol, 1), max(max_vol * 5, 1)
 
-def _skew_score(yes_bid: float, no_ask: float) -> float:
+
+def _score_kernel(
+    spread: float,
+    midpoint: float,
+    skew: float,
+    volume_24h: int,
+    open_interest: int,
+    vol_cap: int,
+    oi_cap: int,
+) -> float:
     """
-    On a fair book: yes_bid + no_ask should equal ~100.
-    A gap means the market maker left a pricing inconsistency.
+    Weighted composite anomaly score from raw numbers.
+
+    The spread, liquidity and skew component scores are computed inline so
+    scoring a market is plain float arithmetic with no helper calls.
     """
-    gap = abs(yes_bid + no_ask - 100)
-    return min(gap / 20.0, 1.0)   # saturates at 20-cent gap
+    # 1. Spread: higher for a larger spread relative to midpoint. A 20-cent spread
+    #    on a 50-cent market is significant; saturates at 50% relative spread
+    s_score = min(spread / max(midpoint, 1) / 0.5, 1.0) if midpoint > 0 else 0.0
 
+    # 2. Liquidity: higher for lower volume (more illiquid)
+    # Divide rather than multiply by a reciprocal: the product can be an ulp off,
+    # which flips the rounded score on exact ties
+    vol_score = 1.0 - min(volume_24h / vol_cap, 1.0)
+    oi_score = 1.0 - min(open_interest / oi_cap, 1.0)
+    l_score = 0.6 * vol_score + 0.4 * oi_score
 
-def score_market(market: dict, volume_threshold: int = 500) -> Optional[MarketSignal]:
+    # 3. Skew: on a fair book yes_bid + no_ask should equal ~100; a gap means the
+    #    market maker left a pricing inconsistency. Saturates at a 20-cent gap
+    k_score = min(skew / 20.0, 1.0)
+
+    # Prices are integer cents, so the composite often lands exactly on a .0005 tie;
+    # round() is kept so those ties resolve as they always have
+    return round(0.40 * s_score + 0.35 * l_score + 0.25 * k_score, 3)
+
+
+def _score_numbers(market: dict, vol_cap: int, oi_cap: int) -> Optional[tuple]:
     """
-    Given a raw Kalshi market dict, return a MarketSignal if scoreable, else None.
+    Numeric half of score_market: the raw prices plus derived scores as a plain tuple,
+    or None if the market has no active pricing. Cheap enough to run on every market.
     """
-    ticker = market.get("ticker", "")
-
     yes_bid = market.get("yes_bid", 0) or 0
     yes_ask = market.get("yes_ask", 0) or 0
     no_bid = market.get("no_bid", 0) or 0
@@ -78,12 +105,21 @@ def score_market(market: dict, volume_threshold: int = 500) -> Optional[MarketSi
     midpoint = (yes_bid + yes_ask) / 2.0
     skew = abs(yes_bid + no_ask - 100)
 
-    s_score = _spread_score(spread, midpoint)
-    l_score = _liquidity_score(volume_24h, open_interest, volume_threshold)
-    k_score = _skew_score(yes_bid, no_ask)
+    anomaly_score = _score_kernel(spread, midpoint, skew, volume_24h, open_interest, vol_cap, oi_cap)
+
+    return (
+        anomaly_score, spread, volume_24h, midpoint, skew,
+        yes_bid, yes_ask, no_bid, no_ask, open_interest,
+    )
 
-    # Weighted composite
-    anomaly_score = round(0.40 * s_score + 0.35 * l_score + 0.25 * k_score, 3)
+
+def _build_signal(market: dict, nums: tuple, volume_threshold: int) -> MarketSignal:
+    """Materialise a MarketSignal from a market dict and its _score_numbers tuple."""
+    (
+        anomaly_score, spread, volume_24h, midpoint, skew,
+        yes_bid, yes_ask, no_bid, no_ask, open_interest,
+    ) = nums
+    ticker = market.get("ticker", "")
 
     flags: list[str] = []
     if spread >= 10:
@@ -107,35 +143,67 @@ def score_market(market: dict, volume_threshold: int = 500) -> Optional[MarketSi
         midpoint=midpoint,
         skew=skew,
         anomaly_score=anomaly_score,
-        flags=flags,
+        flags=tuple(flags),
         close_time=market.get("close_time"),
         event_ticker=market.get("event_ticker"),
         subtitle=market.get("subtitle") or None,
     )
 
 
+def score_market(market: dict, volume_threshold: int = 500) -> Optional[MarketSignal]:
+    """
+    Given a raw Kalshi market dict, return a MarketSignal if scoreable, else None.
+    """
+    nums = _score_numbers(market, *_liquidity_caps(volume_threshold))
+    if nums is None:
+        return None
+    return _build_signal(market, nums, volume_threshold)
+
+
+def _iter_signals(
+    markets: Iterable[dict],
+    min_score: float,
+    volume_threshold: int,
+    spread_threshold: float,
+    min_volume: int,
+) -> Iterator[MarketSignal]:
+    """Yield a MarketSignal for each market that passes the score, spread and volume checks."""
+    vol_cap, oi_cap = _liquidity_caps(volume_threshold)
+    for m in markets:
+        nums = _score_numbers(m, vol_cap, oi_cap)
+        if nums is None:
+            continue
+        anomaly_score, spread, volume_24h = nums[:3]
+        if volume_24h < min_volume:
+            continue
+        if anomaly_score >= min_score:
+            yield _build_signal(m, nums, volume_threshold)
+        # Also include any market that meets the spread threshold even if score is lower
+        elif spread >= spread_threshold:
+            sig = _build_signal(m, nums, volume_threshold)
+            sig.flags += ("spread-threshold",)
+            yield sig
+
+
 def find_anomalies(
-    markets: list[dict],
+    markets: Iterable[dict],
     min_score: float = 0.5,
     volume_threshold: int = 500,
     spread_threshold: float = 10.0,
     min_volume: int = 1,
+    top_k: Optional[int] = None,
 ) -> list[MarketSignal]:
     """
     Score all markets and return those that exceed min_score,
     sorted by anomaly_score descending.
-    """
-    signals: list[MarketSignal] = []
-    for m in markets:
-        sig = score_market(m, volume_threshold=volume_threshold)
-        if sig and sig.volume_24h < min_volume:
-            continue
-        if sig and sig.anomaly_score >= min_score:
-            signals.append(sig)
-        # Also include any market that meets the spread threshold even if score is lower
-        elif sig and sig.spread >= spread_threshold:
-            sig.flags.append("spread-threshold")
-            signals.append(sig)
 
-    signals.sort(key=lambda s: s.anomaly_score, reverse=True)
-    return signals
+    Markets may be a lazy stream (e.g. KalshiClient.stream_markets); they are
+    scored numerically as they arrive and a MarketSignal is only built for the
+    few that are kept. With top_k set, only the top_k highest-scoring signals
+    are returned, and only that many are held while scanning.
+    """
+    signals = _iter_signals(markets, min_score, volume_threshold, spread_threshold, min_volume)
+    if top_k is None:
+        return sorted(signals, key=attrgetter("anomaly_score"), reverse=True)
+    # nlargest keeps a bounded heap of top_k, so this is O(N log K) and O(K) memory
+    return heapq.nlargest(top_k, signals, key=attrgetter("anomaly_score"))
@@ -14,12 +14,14 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from .kalshi_client import KalshiClient
-from .analyzer import find_anomalies
-from .reporter import print_report, write_json_report
-
 
 def main() -> None:
+    # Imported here rather than at module level so importing the CLI (tests, entry-point
+    # discovery) doesn't pay for httpx/cryptography until a scan actually runs
+    from .kalshi_client import KalshiClient
+    from .analyzer import find_anomalies
+    from .reporter import print_report, write_json_report
+
     env = os.getenv("KALSHI_ENV", "prod")
     min_score = float(os.getenv("MIN_ANOMALY_SCORE", "0.5"))
     max_volume = int(os.getenv("MAX_VOLUME_THRESHOLD", "500"))
@@ -33,11 +35,12 @@ def main() -> None:
     print(f"[kalshibot] connecting to Kalshi ({env})...")
     client = KalshiClient(env=env)
 
-    print(f"[kalshibot] fetching open markets closing within {resolve_days} days...")
-    markets = client.iter_markets(status="open", max_markets=max_markets, max_close_ts=cutoff_ts)
-    print(f"[kalshibot] {len(markets)} markets retrieved")
-
     min_volume = int(os.getenv("MIN_VOLUME", "1"))
+    max_signals = int(os.getenv("MAX_SIGNALS", "200"))
+
+    print(f"[kalshibot] fetching open markets closing within {resolve_days} days...")
+    # Markets are scored page by page as they stream in rather than held all at once
+    markets = client.stream_markets(status="open", max_markets=max_markets, max_close_ts=cutoff_ts)
 
     signals = find_anomalies(
         markets,
@@ -45,6 +48,7 @@ def main() -> None:
         volume_threshold=max_volume,
         spread_threshold=min_spread,
         min_volume=min_volume,
+        top_k=max_signals or None,  # MAX_SIGNALS=0 disables the cap
     )
 
     print_report(signals)
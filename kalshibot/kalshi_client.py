@@ -7,30 +7,60 @@ import os
 import base64
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROD_BASE = "https://api.elections.kalshi.com/trade-api/v2"
 DEMO_BASE = "https://demo-api.kalshi.co/trade-api/v2"
 
+MAX_RETRIES = 3         # retries on HTTP 429 before giving up
+MAX_CANDLE_BATCH = 100  # most market tickers accepted per batch candlestick request
+MAX_RETRY_DELAY = 30.0  # cap on a server's Retry-After, in seconds
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited request.
+
+    Honours a numeric Retry-After header up to MAX_RETRY_DELAY, so one long value can't
+    park a monitor worker for the whole poll; otherwise backs off exponentially.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            pass
+    return 0.5 * 2 ** attempt
+
 
-def _sign_request(method: str, path: str, body: str, key_id: str, private_key_pem: str) -> dict[str, str]:
-    """Build Kalshi HMAC-style RSA signature headers."""
+def _load_private_key(private_key_pem: str) -> Any:
+    """Parse a PEM-encoded RSA private key once, for reuse across requests."""
     try:
-        from cryptography.hazmat.primitives import hashes, serialization
-        from cryptography.hazmat.primitives.asymmetric import padding
+        from cryptography.hazmat.primitives import serialization
         from cryptography.hazmat.backends import default_backend
     except ImportError:
         raise ImportError(
             "Install 'cryptography' to use RSA-signed requests: pip install cryptography"
         )
 
-    ts_ms = str(int(time.time() * 1000))
-    msg = ts_ms + method.upper() + path + body
-    private_key = serialization.load_pem_private_key(
+    return serialization.load_pem_private_key(
         private_key_pem.encode(), password=None, backend=default_backend()
     )
+
+
+def _sign_request(method: str, path: str, body: str, key_id: str, private_key: Any) -> dict[str, str]:
+    """Build Kalshi HMAC-style RSA signature headers from a loaded private key."""
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    ts_ms = str(int(time.time() * 1000))
+    msg = ts_ms + method.upper() + path + body
     signature = private_key.sign(msg.encode(), padding.PKCS1v15(), hashes.SHA256())
     return {
         "KALSHI-ACCESS-KEY": key_id,
@@ -51,19 +81,36 @@ class KalshiClient:
         else:
             self.private_key_pem = rsa_env
 
-        self._client = httpx.Client(timeout=30)
+        # Key objects are immutable, so one parsed key is shared by every request/thread
+        self._private_key = (
+            _load_private_key(self.private_key_pem)
+            if self.api_key_id and self.private_key_pem
+            else None
+        )
+        # HTTP/2 lets concurrent monitor threads multiplex over one TLS connection
+        self._client = httpx.Client(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
 
     def _headers(self, method: str, path: str, body: str = "") -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
-        if self.api_key_id and self.private_key_pem:
-            headers.update(_sign_request(method, path, body, self.api_key_id, self.private_key_pem))
+        if self._private_key is not None:
+            headers.update(_sign_request(method, path, body, self.api_key_id, self._private_key))
         return headers
 
     def _get(self, path: str, params: Optional[Dict] = None) -> Any:
         url = self.base_url + path
-        r = self._client.get(url, headers=self._headers("GET", path), params=params)
+        for attempt in range(MAX_RETRIES + 1):
+            # Re-sign on every attempt: the signature covers the request timestamp
+            r = self._client.get(url, headers=self._headers("GET", path), params=params)
+            if r.status_code != 429 or attempt == MAX_RETRIES:
+                break
+            time.sleep(_retry_delay(r, attempt))
         r.raise_for_status()
-        return r.json()
+        # orjson parses the raw bytes directly, skipping the bytes -> str decode
+        return orjson.loads(r.content) if orjson is not None else r.json()
 
     # ------------------------------------------------------------------
     # Markets
@@ -86,15 +133,20 @@ class KalshiClient:
             params["series_ticker"] = series_ticker
         return self._get("/markets", params=params)
 
-    def iter_markets(
+    def stream_markets(
         self,
         status: str = "open",
         max_markets: int = 10000,
         max_close_ts: Optional[int] = None,
         series_ticker: Optional[str] = None,
-    ) -> list[dict]:
-        """Page through all markets and return a flat list, capped at max_markets."""
-        markets: list[dict] = []
+        progress: bool = True,
+    ) -> Iterator[dict]:
+        """Page through all markets, yielding each one as its page arrives, capped at max_markets.
+
+        Only the current page is held in memory. Pass progress=False when paging several
+        series concurrently, so the in-place page counters don't interleave on stdout.
+        """
+        fetched = 0
         cursor = None
         page_num = 0
         while True:
@@ -104,15 +156,34 @@ class KalshiClient:
                 max_close_ts=max_close_ts,
                 series_ticker=series_ticker,
             )
-            markets.extend(page.get("markets", []))
+            batch = page.get("markets", [])[:max_markets - fetched]
+            fetched += len(batch)
             page_num += 1
             cursor = page.get("cursor")
-            print(f"  page {page_num} — {len(markets)} markets fetched...", end="\r", flush=True)
-            if not cursor or len(markets) >= max_markets:
+            if progress:
+                print(f"  page {page_num} — {fetched} markets fetched...", end="\r", flush=True)
+            yield from batch
+            if not cursor or fetched >= max_markets:
                 break
-            time.sleep(0.5)
-        print()  # newline after the \r updates
-        return markets[:max_markets]
+        if progress:
+            print()  # newline after the \r updates
+
+    def iter_markets(
+        self,
+        status: str = "open",
+        max_markets: int = 10000,
+        max_close_ts: Optional[int] = None,
+        series_ticker: Optional[str] = None,
+        progress: bool = True,
+    ) -> list[dict]:
+        """Page through all markets and return a flat list, capped at max_markets."""
+        return list(self.stream_markets(
+            status=status,
+            max_markets=max_markets,
+            max_close_ts=max_close_ts,
+            series_ticker=series_ticker,
+            progress=progress,
+        ))
 
     def get_market(self, ticker: str) -> dict:
         return self._get(f"/markets/{ticker}")
@@ -140,3 +211,22 @@ class KalshiClient:
             "period_interval": period_interval,
         })
         return data.get("candlesticks", [])
+
+    def get_candlesticks_batch(
+        self,
+        market_tickers: list[str],
+        start_ts: int,
+        end_ts: int,
+        period_interval: int = 60,
+    ) -> dict[str, list[dict]]:
+        """Fetch candlestick history for up to MAX_CANDLE_BATCH markets in one request.
+
+        Returns {market_ticker: candlesticks}; tickers with no history may be absent.
+        """
+        data = self._get("/markets/candlesticks", params={
+            "market_tickers": ",".join(market_tickers),
+            "start_ts": start_ts,
+            "end_ts": end_ts,
+            "period_interval": period_interval,
+        })
+        return {m["market_ticker"]: m.get("candlesticks", []) for m in data.get("markets", [])}
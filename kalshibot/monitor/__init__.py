@@ -10,18 +10,58 @@ Usage:
     kalshibot-monitor                    # if installed via pip
 """
 
+import itertools
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
 
+import httpx
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from kalshibot.kalshi_client import KalshiClient
-from kalshibot.soccer import detect_movements
+from kalshibot.kalshi_client import MAX_CANDLE_BATCH, KalshiClient
+from kalshibot.soccer import MovementAlert, detect_movements
 from kalshibot.reporter import print_movement_alerts, write_movement_report
 
+# Batch candlestick statuses meaning "endpoint not available here", the only case where
+# falling back to one request per market is worth it
+_BATCH_UNSUPPORTED = (400, 404)
+
+
+def _fetch_candles(client: KalshiClient, chunk: list[dict], start_ts: int, end_ts: int) -> dict[str, list[dict]]:
+    """Candles for a chunk of markets keyed by ticker, in one request where possible."""
+    try:
+        return client.get_candlesticks_batch(
+            [m["ticker"] for m in chunk],
+            start_ts=start_ts,
+            end_ts=end_ts,
+        )
+    except Exception as e:
+        status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else None
+        # A 429 that outlived the client's retries, a 5xx, a network error or a malformed
+        # body would only be multiplied by the chunk size if retried per market, so skip
+        # the chunk; like any per-fetch failure it must not take down the whole cycle
+        if status not in _BATCH_UNSUPPORTED:
+            print(f"[monitor] candle batch failed ({status or type(e).__name__}) — "
+                  f"skipping {len(chunk)} markets this cycle")
+            return {}
+    # Batch endpoint unavailable: fall back to one request per market
+    candles_by_ticker = {}
+    for market in chunk:
+        try:
+            candles_by_ticker[market["ticker"]] = client.get_candlesticks(
+                series_ticker=market["event_ticker"].partition("-")[0],
+                market_ticker=market["ticker"],
+                start_ts=start_ts,
+                end_ts=end_ts,
+            )
+        except Exception:
+            continue
+    return candles_by_ticker
+
 
 def run_monitor() -> None:
     env = os.getenv("KALSHI_ENV", "prod")
@@ -35,57 +75,59 @@ def run_monitor() -> None:
     long_cents = float(os.getenv("PRICE_MOVE_LONG_CENTS", "10"))
     volume_multiplier = float(os.getenv("VOLUME_SPIKE_MULTIPLIER", "2.0"))
     max_spread_cents = float(os.getenv("MAX_SPREAD_CENTS", "20"))
+    workers = int(os.getenv("MONITOR_WORKERS", "8"))
 
     mode = "one-shot" if poll_once else f"poll every {poll_interval}m"
     print(f"[monitor] starting EPL monitor ({mode})")
     client = KalshiClient(env=env)
 
     while True:
+        # Monotonic so the cadence survives wall-clock (NTP) adjustments
+        cycle_start = time.monotonic()
         now = int(time.time())
         lookback_start = now - (long_hours * 3600)
         ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
         print(f"\n[monitor] {ts} — fetching EPL markets...")
 
-        markets = []
-        for series in soccer_series:
-            batch = client.iter_markets(series_ticker=series, max_markets=500)
-            markets.extend(batch)
+        # Each series pages independently, so paginate them all at once
+        with ThreadPoolExecutor(max_workers=len(soccer_series)) as pool:
+            batches = pool.map(
+                lambda series: client.iter_markets(series_ticker=series, max_markets=500, progress=False),
+                soccer_series,
+            )
+            markets = list(itertools.chain.from_iterable(batches))
 
         print(f"[monitor] {len(markets)} EPL markets — checking for movements...")
 
-        alerts = []
-        for market in markets:
-            event_ticker = market.get("event_ticker", "")
-            series_ticker = event_ticker.split("-")[0] if event_ticker else ""
-            if not series_ticker:
-                continue
-
-            try:
-                candles = client.get_candlesticks(
-                    series_ticker=series_ticker,
-                    market_ticker=market["ticker"],
-                    start_ts=lookback_start,
-                    end_ts=now,
+        def _process_chunk(chunk: list[dict]) -> list[MovementAlert]:
+            candles_by_ticker = _fetch_candles(client, chunk, lookback_start, now)
+            chunk_alerts = []
+            for market in chunk:
+                alert = detect_movements(
+                    market,
+                    candles_by_ticker.get(market["ticker"], []),
+                    short_minutes=short_minutes,
+                    short_cents=short_cents,
+                    long_hours=long_hours,
+                    long_cents=long_cents,
+                    volume_multiplier=volume_multiplier,
+                    max_spread_cents=max_spread_cents,
                 )
-            except Exception:
-                continue
-
-            alert = detect_movements(
-                market,
-                candles,
-                short_minutes=short_minutes,
-                short_cents=short_cents,
-                long_hours=long_hours,
-                long_cents=long_cents,
-                volume_multiplier=volume_multiplier,
-                max_spread_cents=max_spread_cents,
-            )
-            if alert:
-                alerts.append(alert)
+                if alert:
+                    chunk_alerts.append(alert)
+            return chunk_alerts
+
+        # Coalesce candle fetches into batch requests of up to MAX_CANDLE_BATCH markets,
+        # then overlap those round-trips on a bounded thread pool (bounded to stay
+        # clear of Kalshi's rate limits)
+        with_series = [m for m in markets if m.get("event_ticker")]
+        chunks = [with_series[i:i + MAX_CANDLE_BATCH] for i in range(0, len(with_series), MAX_CANDLE_BATCH)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            alerts = list(itertools.chain.from_iterable(pool.map(_process_chunk, chunks)))
 
         if alerts:
-            alerts.sort(key=lambda a: a.magnitude, reverse=True)
+            alerts.sort(key=attrgetter("magnitude"), reverse=True)
             print_movement_alerts(alerts)
             write_movement_report(alerts, output_dir=output_dir)
         else:
@@ -95,4 +137,7 @@ def run_monitor() -> None:
             break
 
         print(f"[monitor] next check in {poll_interval}m")
-        time.sleep(poll_interval * 60)
+        # Sleep until the next cycle is due, not a full interval after this one finished
+        sleep_for = cycle_start + poll_interval * 60 - time.monotonic()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
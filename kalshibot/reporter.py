@@ -2,18 +2,32 @@
 Write scan results to stdout (rich table) and/or a dated log file.
 """
 
+import dataclasses
 import json
 import os
 import re
+import sys
+from collections import defaultdict
 from datetime import datetime, timezone
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Iterator, Optional, TYPE_CHECKING, Union
 
 from .analyzer import MarketSignal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from .soccer import MovementAlert
 
+_TS_FMT = "%Y-%m-%d %H:%M UTC"     # report title timestamps
+
+# Fixture keys start with a YYMONDD date, e.g. "26MAR14" in "26MAR14NEWEVE"
+_FIXTURE_DATE_RE = re.compile(r'^\d{2}[A-Z]{3}\d{2}(.+)$')
+
 
 def _fmt_cents(v: float) -> str:
     return f"{v:.0f}¢"
@@ -24,33 +38,88 @@ def _fmt_mid(v: float) -> str:
     return f"{v:.1f}¢"
 
 
+def _ensure_dir(output_dir: str) -> Path:
+    """Create output_dir if needed. Not cached: the monitor outlives rotations of the directory."""
+    path = Path(output_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib fallback for the one type orjson handles natively: dataclasses."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialise to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Dataclasses are serialised directly, without building intermediate dicts.
+    Every MarketSignal / MovementAlert field is a str, number, None, list or
+    tuple, so there is no str() catch-all: an unexpected type raises TypeError
+    instead of being written as its repr.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_json_default).encode()
+
+
 def write_json_report(signals: list[MarketSignal], output_dir: str = "./output") -> Path:
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
     date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    path = Path(output_dir) / f"scan_{date_str}.json"
-    data = [s.__dict__ for s in signals]
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    path = _ensure_dir(output_dir) / f"scan_{date_str}.json"
+    # Encode and write one signal at a time so only a single record's bytes are held,
+    # not the whole report. Each record is re-indented one level, which keeps the
+    # file byte-identical to dumping the list in one go
+    with open(path, "wb") as f:
+        f.write(b"[")
+        sep = b"\n  "
+        for s in signals:
+            f.write(sep + _dumps(s, indent=True).replace(b"\n", b"\n  "))
+            sep = b",\n  "
+        f.write(b"\n]" if signals else b"]")
     return path
 
 
 def print_report(signals: list[MarketSignal], top_n: int = 20) -> None:
+    if not signals:
+        return
+    now_str = datetime.now(timezone.utc).strftime(_TS_FMT)
+    # Rich's markup and layout only pay off on a terminal; cron/piped output
+    # gets the plain table and never imports rich at all
+    if not sys.stdout.isatty():
+        _print_plain(signals[:top_n], now_str)
+        return
     try:
-        from rich.console import Console
-        from rich.table import Table
-        _print_rich(signals[:top_n])
+        _print_rich(signals[:top_n], now_str)
     except ImportError:
-        _print_plain(signals[:top_n])
+        _print_plain(signals[:top_n], now_str)
 
 
-def _print_rich(signals: list[MarketSignal]) -> None:
+def _print_rich(signals: list[MarketSignal], now_str: str) -> None:
     from rich.console import Console
     from rich.table import Table
     from rich import box
 
+    # Format every cell up front in one comprehension; the add_row loop then only hands
+    # strings to rich
+    rows = [
+        (
+            f"{s.anomaly_score:.2f}",
+            f"[link={s.url}]{s.ticker}[/link]",
+            f"{s.yes_bid:.0f}¢ / {s.yes_ask:.0f}¢",
+            f"{s.spread:.0f}¢",
+            str(s.volume_24h),
+            ", ".join(s.flags) or "—",
+            s.title,
+            s.subtitle or "—",
+        )
+        for s in signals
+    ]
+
     console = Console()
     table = Table(
-        title=f"Kalshi Anomaly Scan — {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
+        title=f"Kalshi Anomaly Scan — {now_str}",
         box=box.ROUNDED,
         show_lines=True,
     )
@@ -63,54 +132,42 @@ def _print_rich(signals: list[MarketSignal]) -> None:
     table.add_column("Title")
     table.add_column("Bet")
 
-    for s in signals:
-        base = (s.event_ticker or s.ticker).rsplit("-", 1)[0]
-        url = f"https://kalshi.com/markets/{base}"
-        table.add_row(
-            f"{s.anomaly_score:.2f}",
-            f"[link={url}]{s.ticker}[/link]",
-            f"{_fmt_cents(s.yes_bid)} / {_fmt_cents(s.yes_ask)}",
-            _fmt_cents(s.spread),
-            str(s.volume_24h),
-            ", ".join(s.flags) or "—",
-            s.title,
-            s.subtitle or "—",
-        )
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print(f"[dim]{len(signals)} market(s) flagged[/dim]")
 
 
-def _print_plain(signals: list[MarketSignal]) -> None:
-    print(f"\n=== Kalshi Anomaly Scan {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')} ===")
-    print(f"{'Score':>6}  {'Ticker':<24}  {'Bid/Ask':>12}  {'Spread':>7}  {'Vol':>6}  Flags")
-    print("-" * 90)
-    for s in signals:
-        print(
-            f"{s.anomaly_score:>6.2f}  {s.ticker:<24}  "
-            f"{_fmt_cents(s.yes_bid)}/{_fmt_cents(s.yes_ask):>6}  "
-            f"{_fmt_cents(s.spread):>7}  {s.volume_24h:>6}  {', '.join(s.flags)}"
-            f"\n        https://kalshi.com/markets/{(s.event_ticker or s.ticker).rsplit('-', 1)[0]}"
-        )
-    print(f"\n{len(signals)} market(s) flagged")
+def _print_plain(signals: list[MarketSignal], now_str: str) -> None:
+    # Build the whole report and write it once rather than one print() per row
+    lines = [
+        f"\n=== Kalshi Anomaly Scan {now_str} ===",
+        f"{'Score':>6}  {'Ticker':<24}  {'Bid/Ask':>12}  {'Spread':>7}  {'Vol':>6}  Flags",
+        "-" * 90,
+    ]
+    lines.extend(
+        f"{s.anomaly_score:>6.2f}  {s.ticker:<24}  "
+        f"{_fmt_cents(s.yes_bid)}/{_fmt_cents(s.yes_ask):>6}  "
+        f"{_fmt_cents(s.spread):>7}  {s.volume_24h:>6}  {', '.join(s.flags)}"
+        f"\n        {s.url}"
+        for s in signals
+    )
+    lines.append(f"\n{len(signals)} market(s) flagged")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ------------------------------------------------------------------
 # Movement alert reporter (EPL monitor)
 # ------------------------------------------------------------------
 
-def _market_url(event_ticker: str, ticker: str) -> str:
-    base = (event_ticker or ticker).rsplit("-", 1)[0]
-    return f"https://kalshi.com/markets/{base}"
-
-
 def _fixture_key(event_ticker: str) -> str:
     """Strip series prefix to get the fixture identifier, shared across all series for a game.
 
     e.g. "KXEPLGAME-26MAR14NEWEVE" and "KXEPLSPREAD-26MAR14NEWEVE" both return "26MAR14NEWEVE".
     """
-    parts = (event_ticker or "").split("-", 1)
-    return parts[1] if len(parts) > 1 else event_ticker
+    _, sep, rest = (event_ticker or "").partition("-")
+    return rest if sep else event_ticker
 
 
 def _fmt_fixture_key(key: str) -> str:
@@ -118,7 +175,7 @@ def _fmt_fixture_key(key: str) -> str:
 
     e.g. "26FEB28EVENE" -> "EVENE", "26MAR14NEWEVE" -> "NEWEVE"
     """
-    m = re.match(r'^\d{2}[A-Z]{3}\d{2}(.+)$', key)
+    m = _FIXTURE_DATE_RE.match(key)
     return m.group(1) if m else key
 
 
@@ -141,6 +198,12 @@ def _game_label(group: list) -> str:
 
 
 def print_movement_alerts(alerts: "list[MovementAlert]") -> None:
+    now_str = datetime.now(timezone.utc).strftime(_TS_FMT)
+    # Same gate as print_report: the monitor usually runs unattended, so piped
+    # output skips rich's grouped table
+    if not sys.stdout.isatty():
+        _print_movement_plain(alerts, now_str)
+        return
     try:
         from rich.console import Console
         from rich.table import Table
@@ -148,9 +211,9 @@ def print_movement_alerts(alerts: "list[MovementAlert]") -> None:
 
         console = Console()
         table = Table(
-            title=f"EPL Movement Alerts — {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}",
+            title=f"EPL Movement Alerts — {now_str}",
             box=box.ROUNDED,
-            show_lines=True,
+            # No rule under every row: add_section() below already separates games
         )
         table.add_column("Market", style="cyan")
         table.add_column("Bet")
@@ -161,23 +224,32 @@ def print_movement_alerts(alerts: "list[MovementAlert]") -> None:
 
         # Group by fixture key (strips series prefix so WIN/BTTS/TOTAL/SPREAD for the same
         # game land in the same group), sorted by kickoff time
-        groups: dict = {}
+        groups: defaultdict[str, list] = defaultdict(list)
         for a in alerts:
-            key = _fixture_key(a.event_ticker or a.ticker)
-            groups.setdefault(key, []).append(a)
-        # Within each group: KXEPLGAME first (best title), then by magnitude descending
+            groups[_fixture_key(a.event_ticker or a.ticker)].append(a)
+        # Within each group: KXEPLGAME first (best title), then by magnitude descending.
+        # Sort by magnitude with a C-level key, then stable-partition the KXEPLGAME
+        # alerts to the front, instead of building a tuple key per alert
         for g in groups.values():
-            g.sort(key=lambda a: (a.series_ticker != "KXEPLGAME", -a.magnitude))
-        sorted_groups = sorted(groups.values(), key=lambda g: g[0].close_time or "")
+            g.sort(key=attrgetter("magnitude"), reverse=True)
+            g[:] = [a for a in g if a.series_ticker == "KXEPLGAME"] + [
+                a for a in g if a.series_ticker != "KXEPLGAME"
+            ]
+        # Pair each group with its lead alert's close time once; it drives both the
+        # ordering and the kickoff column
+        sorted_groups = sorted(
+            ((g[0].close_time or "", g) for g in groups.values()),
+            key=itemgetter(0),
+        )
 
         first = True
-        for group in sorted_groups:
+        for close_time, group in sorted_groups:
             if not first:
                 table.add_section()
             first = False
 
             game_name = _game_label(group)
-            kickoff = group[0].close_time[:16].replace("T", " ") + " UTC" if group[0].close_time else "—"
+            kickoff = close_time[:16].replace("T", " ") + " UTC" if close_time else "—"
             table.add_row(
                 f"[bold white]{game_name}[/bold white]",
                 "", "", "", "",
@@ -186,21 +258,27 @@ def print_movement_alerts(alerts: "list[MovementAlert]") -> None:
             )
 
             for a in group:
-                url = _market_url(a.event_ticker, a.ticker)
-                history_lines = []
-                if a.midpoint_long_ago is not None:
-                    arrow = "↑" if a.midpoint > a.midpoint_long_ago else "↓"
-                    history_lines.append(f"{_fmt_mid(a.midpoint_long_ago)} {arrow} {_fmt_mid(a.midpoint)}  (12h)")
-                if a.midpoint_short_ago is not None:
-                    arrow = "↑" if a.midpoint > a.midpoint_short_ago else "↓"
-                    history_lines.append(f"{_fmt_mid(a.midpoint_short_ago)} {arrow} {_fmt_mid(a.midpoint)}  (30m)")
-                if a.volume_earlier is not None and a.volume_recent is not None:
-                    history_lines.append(f"vol  {a.volume_earlier} → {a.volume_recent}")
+                # Fixed three-slot history (12h, 30m, volume); empty slots are dropped
+                # by the join instead of growing a list per alert
+                long_ago = (
+                    f"{_fmt_mid(a.midpoint_long_ago)} {'↑' if a.midpoint > a.midpoint_long_ago else '↓'} "
+                    f"{_fmt_mid(a.midpoint)}  (12h)"
+                    if a.midpoint_long_ago is not None else ""
+                )
+                short_ago = (
+                    f"{_fmt_mid(a.midpoint_short_ago)} {'↑' if a.midpoint > a.midpoint_short_ago else '↓'} "
+                    f"{_fmt_mid(a.midpoint)}  (30m)"
+                    if a.midpoint_short_ago is not None else ""
+                )
+                volume = (
+                    f"vol  {a.volume_earlier} → {a.volume_recent}"
+                    if a.volume_earlier is not None and a.volume_recent is not None else ""
+                )
                 table.add_row(
-                    f"[link={url}]{a.title}[/link]",
+                    f"[link={a.url}]{a.title}[/link]",
                     a.subtitle or "—",
-                    f"{_fmt_cents(a.yes_bid)} / {_fmt_cents(a.yes_ask)}",
-                    "\n".join(history_lines) or "—",
+                    f"{a.yes_bid:.0f}¢ / {a.yes_ask:.0f}¢",
+                    "\n".join(x for x in (long_ago, short_ago, volume) if x) or "—",
                     "\n".join(a.alerts),
                     "",
                 )
@@ -209,26 +287,36 @@ def print_movement_alerts(alerts: "list[MovementAlert]") -> None:
         console.print(f"[dim]{len(alerts)} alert(s) across {len(groups)} game(s)[/dim]")
 
     except ImportError:
-        print(f"\n=== EPL Movement Alerts {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')} ===")
-        for a in alerts:
-            url = _market_url(a.event_ticker, a.ticker)
-            print(f"  {a.title} — {', '.join(a.alerts)}")
-            print(f"  {url}")
-        print(f"\n{len(alerts)} alert(s)")
+        _print_movement_plain(alerts, now_str)
+
+
+def _print_movement_plain(alerts: "list[MovementAlert]", now_str: str) -> None:
+    lines = [f"\n=== EPL Movement Alerts {now_str} ==="]
+    for a in alerts:
+        lines.append(f"  {a.title} — {', '.join(a.alerts)}")
+        lines.append(f"  {a.url}")
+    lines.append(f"\n{len(alerts)} alert(s)")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def write_movement_report(alerts: "list[MovementAlert]", output_dir: str = "./output") -> Path:
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    path = Path(output_dir) / f"movements_{date_str}.json"
-    ts = datetime.now(timezone.utc).isoformat()
-    data = [{"ts": ts, **a.__dict__} for a in alerts]
-    # Append to existing file if present
-    existing: list = []
-    if path.exists():
-        with open(path) as f:
-            existing = json.load(f)
-    with open(path, "w") as f:
-        json.dump(existing + data, f, indent=2, default=str)
+    # One clock read, so the file date and record timestamps agree across midnight
+    now = datetime.now(timezone.utc)
+    path = _ensure_dir(output_dir) / f"movements_{now:%Y-%m-%d}.jsonl"
+    ts = now.isoformat()
+    # Shallow record straight from the slots; asdict() would deep-copy every field
+    lines = [_dumps({"ts": ts, **{f: getattr(a, f) for f in a.__slots__}}) + b"\n" for a in alerts]
+    # JSON Lines: each poll appends its alerts without re-reading earlier ones
+    with open(path, "ab") as f:
+        f.write(b"".join(lines))
     print(f"\n[monitor] report saved → {path}")
     return path
+
+
+def read_movement_report(path: Union[str, Path]) -> Iterator[dict]:
+    """Yield each alert record from a movements_YYYY-MM-DD.jsonl report, in file order."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
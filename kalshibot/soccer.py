@@ -7,11 +7,14 @@ Given a market dict and its candlestick history, detects:
   3. Volume spike           — recent candle volume vs earlier candle volume
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from typing import Optional
 
+from .analyzer import market_url
 
-@dataclass
+
+@dataclass(slots=True)
 class MovementAlert:
     ticker: str
     series_ticker: str
@@ -29,22 +32,29 @@ class MovementAlert:
     midpoint_long_ago: Optional[float] = None    # midpoint at start of long window
     volume_recent: Optional[int] = None          # volume in recent half of candles
     volume_earlier: Optional[int] = None         # volume in earlier half of candles
+    url: str = field(init=False)                 # kalshi.com market page, derived once at construction
 
+    def __post_init__(self) -> None:
+        self.url = market_url(self.event_ticker, self.ticker)
 
-def _candle_midpoint(candle: dict) -> Optional[float]:
-    """Midpoint from a candle's yes_bid.close and yes_ask.close."""
-    bid = (candle.get("yes_bid") or {}).get("close")
-    ask = (candle.get("yes_ask") or {}).get("close")
-    if bid is None or ask is None:
-        return None
-    return (bid + ask) / 2.0
 
+def _nearest_candle(candles: list[dict], ts_list: list[int], target_ts: int) -> Optional[dict]:
+    """Return the candle whose end_period_ts is closest to target_ts.
 
-def _nearest_candle(candles: list[dict], target_ts: int) -> Optional[dict]:
-    """Return the candle whose end_period_ts is closest to target_ts."""
+    ts_list holds each candle's end_period_ts in chronological order (as Kalshi returns
+    them), so a binary search finds the two neighbours of target_ts; ties go to the
+    earlier candle.
+    """
     if not candles:
         return None
-    return min(candles, key=lambda c: abs(c["end_period_ts"] - target_ts))
+    i = bisect_left(ts_list, target_ts)
+    if i == 0:
+        return candles[0]
+    if i == len(ts_list):
+        return candles[-1]
+    if ts_list[i] - target_ts < target_ts - ts_list[i - 1]:
+        return candles[i]
+    return candles[i - 1]
 
 
 def detect_movements(
@@ -74,46 +84,49 @@ def detect_movements(
     if (yes_ask - yes_bid) > max_spread_cents:
         return None
     current_mid = (yes_bid + yes_ask) / 2.0
-    current_ts = max(c["end_period_ts"] for c in candles)
+    # Candles are chronological (the volume split below relies on that too)
+    ts_list = [c["end_period_ts"] for c in candles]
+    current_ts = ts_list[-1]
 
     alerts: list[str] = []
     magnitude = 0.0
-    midpoint_short_ago = None
-    midpoint_long_ago = None
     volume_recent = None
     volume_earlier = None
 
-    # 1. Short-term price move
-    short_target_ts = current_ts - (short_minutes * 60)
-    short_candle = _nearest_candle(candles, short_target_ts)
-    if short_candle:
-        short_mid = _candle_midpoint(short_candle)
-        if short_mid is not None:
-            midpoint_short_ago = short_mid
-            move = current_mid - short_mid
-            if abs(move) >= short_cents:
-                direction = "+" if move > 0 else ""
-                alerts.append(f"price {direction}{move:.0f}¢ in {short_minutes}m")
-                magnitude = max(magnitude, abs(move))
-
-    # 2. Long-term price move
-    long_target_ts = current_ts - (long_hours * 3600)
-    long_candle = _nearest_candle(candles, long_target_ts)
-    if long_candle:
-        long_mid = _candle_midpoint(long_candle)
-        if long_mid is not None:
-            midpoint_long_ago = long_mid
-            move = current_mid - long_mid
-            if abs(move) >= long_cents:
-                direction = "+" if move > 0 else ""
-                alerts.append(f"price {direction}{move:.0f}¢ in {long_hours}h")
-                magnitude = max(magnitude, abs(move))
+    # 1–2. Short- and long-term price moves: live midpoint vs the candle nearest
+    #      the start of each window
+    window_mids = []
+    for window_secs, cents, label in (
+        (short_minutes * 60, short_cents, f"{short_minutes}m"),
+        (long_hours * 3600, long_cents, f"{long_hours}h"),
+    ):
+        past_mid = None
+        candle = _nearest_candle(candles, ts_list, current_ts - window_secs)
+        if candle:
+            bid_ohlc = candle.get("yes_bid")
+            ask_ohlc = candle.get("yes_ask")
+            bid = bid_ohlc.get("close") if bid_ohlc else None
+            ask = ask_ohlc.get("close") if ask_ohlc else None
+            if bid is not None and ask is not None:
+                past_mid = (bid + ask) / 2.0
+                move = current_mid - past_mid
+                if abs(move) >= cents:
+                    direction = "+" if move > 0 else ""
+                    alerts.append(f"price {direction}{move:.0f}¢ in {label}")
+                    magnitude = max(magnitude, abs(move))
+        window_mids.append(past_mid)
+    midpoint_short_ago, midpoint_long_ago = window_mids
 
     # 3. Volume spike — split candles in half, compare halves
     if len(candles) >= 4:
         mid = len(candles) // 2
-        volume_earlier = sum(c.get("volume", 0) for c in candles[:mid])
-        volume_recent = sum(c.get("volume", 0) for c in candles[mid:])
+        # One pass with running totals instead of two slices + two sum() generators
+        volume_earlier = volume_recent = 0
+        for i, c in enumerate(candles):
+            if i < mid:
+                volume_earlier += c.get("volume", 0)
+            else:
+                volume_recent += c.get("volume", 0)
         total_volume = volume_earlier + volume_recent
         ratio = volume_recent / (volume_earlier or 1)
         if total_volume > 0 and ratio >= volume_multiplier:
@@ -124,7 +137,7 @@ def detect_movements(
         return None
 
     event_ticker = market.get("event_ticker", "")
-    series_ticker = event_ticker.split("-")[0] if event_ticker else ""
+    series_ticker = event_ticker.partition("-")[0] if event_ticker else ""
 
     return MovementAlert(
         ticker=market.get("ticker", ""),
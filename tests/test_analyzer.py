@@ -0,0 +1,35 @@
+import unittest
+
+from kalshibot.analyzer import MarketSignal, find_anomalies, score_market
+
+
+class ScoreRoundingTest(unittest.TestCase):
+    def test_tie_rounds_like_builtin_round(self):
+        # Integer-cent prices put this composite exactly on a .0005 tie
+        market = {"yes_bid": 11, "yes_ask": 14, "no_ask": 90, "volume_24h": 0, "open_interest": 0}
+        self.assertEqual(score_market(market).anomaly_score, 0.554)
+
+    def test_liquidity_ratio_is_exact_on_ties(self):
+        # 265/300 times a reciprocal is an ulp low, which used to round this down to 0.674
+        market = {"yes_bid": 4, "yes_ask": 41, "no_ask": 18, "volume_24h": 265, "open_interest": 8929}
+        self.assertEqual(score_market(market, volume_threshold=300).anomaly_score, 0.675)
+
+    def test_tie_does_not_cross_min_score(self):
+        market = {"ticker": "T", "yes_bid": 11, "yes_ask": 14, "no_ask": 90,
+                  "volume_24h": 0, "open_interest": 0}
+        kept = find_anomalies([market], min_score=0.555, spread_threshold=99, min_volume=0)
+        self.assertEqual(kept, [])
+
+
+class MarketSignalTest(unittest.TestCase):
+    def test_url_derived_from_tickers(self):
+        sig = MarketSignal(
+            ticker="KXEPLGAME-26MAR14NEWEVE-NEW", title="t", category="", yes_bid=40,
+            yes_ask=44, no_bid=56, no_ask=60, volume_24h=10, open_interest=0, spread=4,
+            midpoint=42.0, skew=0, anomaly_score=0.5, event_ticker="KXEPLGAME-26MAR14NEWEVE",
+        )
+        self.assertEqual(sig.url, "https://kalshi.com/markets/KXEPLGAME")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,24 @@
+import unittest
+
+import httpx
+
+from kalshibot.kalshi_client import MAX_RETRY_DELAY, _retry_delay
+
+
+def _response(retry_after: str = None) -> httpx.Response:
+    return httpx.Response(429, headers={"Retry-After": retry_after} if retry_after else {})
+
+
+class RetryDelayTest(unittest.TestCase):
+    def test_honours_short_retry_after(self):
+        self.assertEqual(_retry_delay(_response("2"), attempt=0), 2.0)
+
+    def test_caps_long_retry_after(self):
+        self.assertEqual(_retry_delay(_response("3600"), attempt=0), MAX_RETRY_DELAY)
+
+    def test_exponential_backoff_without_header(self):
+        self.assertEqual([_retry_delay(_response(), a) for a in range(3)], [0.5, 1.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+import httpx
+
+from kalshibot.kalshi_client import KalshiClient
+from kalshibot.monitor import _fetch_candles
+
+CANDLE = {"end_period_ts": 1000, "volume": 5}
+CHUNK = [
+    {"ticker": "KXEPLGAME-26MAR14NEWEVE-NEW", "event_ticker": "KXEPLGAME-26MAR14NEWEVE"},
+    {"ticker": "KXEPLBTTS-26MAR14NEWEVE", "event_ticker": "KXEPLBTTS-26MAR14NEWEVE"},
+]
+
+
+def _client(batch_status: int, batch_body=None) -> tuple[KalshiClient, list[str]]:
+    """KalshiClient on a mock transport; returns it with the list of paths it requested.
+
+    batch_body is sent as JSON, or verbatim when it is bytes.
+    """
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.endswith("/markets/candlesticks"):
+            headers = {"Retry-After": "0"}
+            if isinstance(batch_body, bytes):
+                return httpx.Response(batch_status, content=batch_body, headers=headers)
+            return httpx.Response(batch_status, json=batch_body or {}, headers=headers)
+        return httpx.Response(200, json={"candlesticks": [CANDLE]})
+
+    client = KalshiClient(api_key_id="test", api_key_rsa="")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return client, paths
+
+
+class BatchCandlesTest(unittest.TestCase):
+    def test_batch_response_keyed_by_market_ticker(self):
+        body = {"markets": [
+            {"market_ticker": "A", "candlesticks": [CANDLE]},
+            {"market_ticker": "B"},
+        ]}
+        client, paths = _client(200, body)
+        self.assertEqual(
+            client.get_candlesticks_batch(["A", "B"], start_ts=0, end_ts=1),
+            {"A": [CANDLE], "B": []},
+        )
+        self.assertEqual(len(paths), 1)
+
+    def test_unsupported_endpoint_falls_back_per_market(self):
+        for status in (400, 404):
+            client, paths = _client(status)
+            candles = _fetch_candles(client, CHUNK, 0, 1)
+            self.assertEqual(candles, {m["ticker"]: [CANDLE] for m in CHUNK})
+            self.assertEqual(paths[1:], [
+                "/trade-api/v2/series/KXEPLGAME/markets/KXEPLGAME-26MAR14NEWEVE-NEW/candlesticks",
+                "/trade-api/v2/series/KXEPLBTTS/markets/KXEPLBTTS-26MAR14NEWEVE/candlesticks",
+            ])
+
+    def test_rate_limit_and_server_errors_skip_the_chunk(self):
+        for status in (429, 500, 503):
+            client, paths = _client(status)
+            self.assertEqual(_fetch_candles(client, CHUNK, 0, 1), {})
+            self.assertTrue(all(p.endswith("/markets/candlesticks") for p in paths))
+
+    def test_malformed_batch_body_skips_the_chunk(self):
+        for body in (b"<html>Bad gateway</html>", {"markets": [{"candlesticks": [CANDLE]}]}):
+            client, paths = _client(200, body)
+            self.assertEqual(_fetch_candles(client, CHUNK, 0, 1), {})
+            self.assertEqual(len(paths), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import contextlib
+import dataclasses
+import io
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from kalshibot import reporter
+from kalshibot.reporter import _print_movement_plain, read_movement_report, write_movement_report
+from kalshibot.soccer import MovementAlert
+
+
+def _alert(ticker: str = "KXEPLGAME-26MAR14NEWEVE-NEW") -> MovementAlert:
+    return MovementAlert(
+        ticker=ticker, series_ticker="KXEPLGAME", event_ticker="KXEPLGAME-26MAR14NEWEVE",
+        title="Newcastle vs Everton Winner?", subtitle="", yes_bid=40, yes_ask=44,
+        midpoint=42.0, volume_24h=120, alerts=["price +8¢ in 30m"], magnitude=8.0,
+        close_time="2026-03-14T15:00:00Z",
+    )
+
+
+class MovementReportTest(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def _write(self, alerts, output_dir) -> Path:
+        with contextlib.redirect_stdout(io.StringIO()):
+            return write_movement_report(alerts, output_dir=str(output_dir))
+
+    def test_records_carry_ts_and_every_alert_field(self):
+        alerts = [_alert("A"), _alert("B")]
+        encoders = [None] + ([reporter.orjson] if reporter.orjson is not None else [])
+        for i, encoder in enumerate(encoders):
+            with mock.patch.object(reporter, "orjson", encoder):
+                path = self._write(alerts, self.root / str(i))
+                records = list(read_movement_report(path))
+            self.assertEqual([r["ticker"] for r in records], ["A", "B"])
+            for record, alert in zip(records, alerts):
+                ts = record.pop("ts")
+                self.assertTrue(path.name.endswith(f"{ts[:10]}.jsonl"))
+                self.assertEqual(record, dataclasses.asdict(alert))
+
+    def test_recreates_output_dir_removed_between_polls(self):
+        out = self.root / "output"
+        self._write([_alert()], out)
+        shutil.rmtree(out)
+        self.assertTrue(self._write([_alert()], out).exists())
+
+
+class MovementAlertPrintTest(unittest.TestCase):
+    def test_plain_output_links_each_alert(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            _print_movement_plain([_alert()], "2026-03-14 12:00 UTC")
+        self.assertIn("  https://kalshi.com/markets/KXEPLGAME\n", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
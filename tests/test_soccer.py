@@ -0,0 +1,45 @@
+import unittest
+
+from kalshibot.soccer import detect_movements
+
+MARKET = {"ticker": "KXEPLGAME-26MAR14NEWEVE-NEW", "event_ticker": "KXEPLGAME-26MAR14NEWEVE",
+          "yes_bid": 60, "yes_ask": 62}
+
+
+def _candle(ts: int, bid=None, ask=None, volume: int = 0) -> dict:
+    c = {"end_period_ts": ts, "volume": volume}
+    if bid is not None:
+        c["yes_bid"] = {"close": bid}
+    if ask is not None:
+        c["yes_ask"] = {"close": ask}
+    return c
+
+
+class DetectMovementsTest(unittest.TestCase):
+    def test_short_and_long_windows(self):
+        now = 10_000
+        candles = [
+            _candle(now - 7200, 30, 32),     # 2h ago: mid 31
+            _candle(now - 1800, 50, 52),     # 30m ago: mid 51
+            _candle(now, 60, 62),
+        ]
+        alert = detect_movements(MARKET, candles)
+        self.assertEqual(alert.alerts, ["price +10¢ in 30m", "price +30¢ in 2h"])
+        self.assertEqual((alert.midpoint_short_ago, alert.midpoint_long_ago), (51.0, 31.0))
+        self.assertEqual(alert.magnitude, 30.0)
+        self.assertEqual(alert.series_ticker, "KXEPLGAME")
+
+    def test_window_without_both_closes_is_skipped(self):
+        now = 10_000
+        candles = [
+            _candle(now - 7200, 30, 32),
+            _candle(now - 1800, bid=50),     # no yes_ask block: no 30m midpoint
+            _candle(now, 60, 62),
+        ]
+        alert = detect_movements(MARKET, candles)
+        self.assertEqual(alert.alerts, ["price +30¢ in 2h"])
+        self.assertIsNone(alert.midpoint_short_ago)
+
+
+if __name__ == "__main__":
+    unittest.main()